@@ -6,28 +6,37 @@ This script demonstrates how to customize the analysis parameters
 and create specialized reports.
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend: charts are only saved to files
+import matplotlib.pyplot as plt
+
 from mcp_health import HealthcareProductivityAnalyzer, HealthcareDataGenerator, HealthcareVisualizer
-from mcp_health.utils import load_config, DEFAULT_CONFIG
+from mcp_health.utils import load_config, config_with, DEFAULT_CONFIG
 import pandas as pd
 import numpy as np
 
 def create_custom_config():
     """Create a custom configuration with modified parameters."""
-    config = DEFAULT_CONFIG.copy()
-    
-    # Modify AI improvement factors for more conservative estimates
-    config['ai_improvements']['admin_efficiency_gain'] = 0.40  # 40% instead of 52%
-    config['ai_improvements']['processing_speed_gain'] = 0.60  # 60% instead of 75%
-    config['ai_improvements']['error_reduction'] = 0.65        # 65% instead of 76%
-    config['ai_improvements']['throughput_increase'] = 0.20    # 20% instead of 24%
-    
-    # Adjust Japanese healthcare constants
-    config['japan_constants']['total_healthcare_cost'] = 48e12  # ¥48 trillion (higher estimate)
-    config['japan_constants']['average_hourly_wage'] = 3500    # ¥3500/hour (higher wage)
+    config = config_with(
+        # Modify AI improvement factors for more conservative estimates
+        ai_improvements={
+            **DEFAULT_CONFIG['ai_improvements'],
+            'admin_efficiency_gain': 0.40,  # 40% instead of 52%
+            'processing_speed_gain': 0.60,  # 60% instead of 75%
+            'error_reduction': 0.65,        # 65% instead of 76%
+            'throughput_increase': 0.20     # 20% instead of 24%
+        },
+        # Adjust Japanese healthcare constants
+        japan_constants={
+            **DEFAULT_CONFIG['japan_constants'],
+            'total_healthcare_cost': 48e12,  # ¥48 trillion (higher estimate)
+            'average_hourly_wage': 3500      # ¥3500/hour (higher wage)
+        }
+    )
     
     return config
 
-def create_scenario_analysis():
+def create_scenario_analysis(datasets):
     """Create multiple scenario analyses with different assumptions."""
     print("🎯 Multi-Scenario Analysis")
     print("=" * 50)
@@ -64,81 +73,80 @@ def create_scenario_analysis():
         }
     }
     
-    # Generate base data once
-    generator = HealthcareDataGenerator(random_seed=42)
-    datasets = generator.generate_all_datasets(save_to_disk=False)
+    # Scenarios differ only in four improvement factors: stack them into an
+    # (n_scenarios, n_factors) matrix and evaluate every scenario in one
+    # broadcasted report instead of one report per scenario
+    factors = ['admin_efficiency_gain', 'processing_speed_gain', 'error_reduction', 'throughput_increase']
+    params = np.array([[scenario_config[factor] for factor in factors] for scenario_config in scenarios.values()])
+    
+    analyzer = HealthcareProductivityAnalyzer()
+    analyzer.data = datasets
+    analyzer.ai_improvements.update(zip(factors, params.T))
+    
+    batch_summary = analyzer.generate_analysis_report()['summary']
     
     scenario_results = {}
     
-    for scenario_key, scenario_config in scenarios.items():
-        print(f"\n📊 Running {scenario_config['name']}...")
+    for i, (scenario_key, scenario_config) in enumerate(scenarios.items()):
+        print(f"\n📊 {scenario_config['name']}:")
         
-        # Create analyzer with custom improvements
-        analyzer = HealthcareProductivityAnalyzer()
-        analyzer.data = datasets
-        
-        # Apply scenario-specific improvements
-        analyzer.ai_improvements.update({
-            'admin_efficiency_gain': scenario_config['admin_efficiency_gain'],
-            'processing_speed_gain': scenario_config['processing_speed_gain'],
-            'error_reduction': scenario_config['error_reduction'],
-            'throughput_increase': scenario_config['throughput_increase']
-        })
-        
-        # Run analysis
-        report = analyzer.generate_analysis_report()
-        scenario_results[scenario_key] = report
+        summary = {name: np.broadcast_to(values, len(params))[i] for name, values in batch_summary.items()}
+        payback = summary['payback_period_years']
+        summary['payback_period_years'] = None if np.isnan(payback) else int(payback)
+        scenario_results[scenario_key] = {'summary': summary}
         
         # Print key metrics
-        summary = report['summary']
         print(f"   Annual Savings: ¥{summary['total_annual_savings_trillion_yen']:.2f}T")
         print(f"   5-Year ROI: {summary['five_year_roi_percentage']:.1f}%")
         print(f"   Payback: {summary['payback_period_years']} years")
     
     return scenario_results
 
-def create_sensitivity_analysis():
+def create_sensitivity_analysis(datasets):
     """Perform sensitivity analysis on key parameters."""
     print("\n🔬 Sensitivity Analysis")
     print("=" * 50)
     
-    # Generate base data
-    generator = HealthcareDataGenerator(random_seed=42)
-    datasets = generator.generate_all_datasets(save_to_disk=False)
-    
     # Parameter ranges for sensitivity analysis
-    admin_efficiency_range = np.arange(0.20, 0.71, 0.10)  # 20% to 70%
-    cost_multiplier_range = np.arange(1.0, 2.1, 0.2)      # 1.0x to 2.0x
-    
-    sensitivity_results = []
-    
-    for admin_eff in admin_efficiency_range:
-        for cost_mult in cost_multiplier_range:
-            analyzer = HealthcareProductivityAnalyzer()
-            analyzer.data = datasets
-            
-            # Modify parameters
-            analyzer.ai_improvements['admin_efficiency_gain'] = admin_eff
-            analyzer.japan_constants['error_cost_multiplier'] = cost_mult
-            
-            # Run analysis
-            report = analyzer.generate_analysis_report()
-            
-            sensitivity_results.append({
-                'admin_efficiency': admin_eff,
-                'cost_multiplier': cost_mult,
-                'annual_savings_trillion': report['summary']['total_annual_savings_trillion_yen'],
-                'roi_percentage': report['summary']['five_year_roi_percentage'],
-                'payback_years': report['summary']['payback_period_years']
-            })
-    
-    # Convert to DataFrame for analysis
-    sensitivity_df = pd.DataFrame(sensitivity_results)
+    admin_efficiency_range = np.linspace(0.20, 0.70, 6)  # 20% to 70%
+    cost_multiplier_range = np.linspace(1.0, 2.0, 6)     # 1.0x to 2.0x
+    
+    # The datasets are fixed across the grid, so compute the baseline once and
+    # evaluate every (admin efficiency, cost multiplier) pair in a single
+    # broadcasted pass instead of running a full report per cell
+    admin_eff, cost_mult = np.meshgrid(admin_efficiency_range, cost_multiplier_range, indexing='ij')
+    
+    analyzer = HealthcareProductivityAnalyzer()
+    analyzer.data = datasets
+    analyzer.ai_improvements['admin_efficiency_gain'] = admin_eff
+    analyzer.japan_constants['error_cost_multiplier'] = cost_mult
+    
+    baseline = analyzer.calculate_baseline_metrics()
+    ai_metrics = analyzer.calculate_ai_impact_metrics(baseline)
+    annual_savings = analyzer.calculate_cost_savings(baseline, ai_metrics)['total_annual_savings']
+    
+    roi_analysis = analyzer.calculate_roi_analysis({'total_annual_savings': annual_savings})
+    roi_percentage = roi_analysis['total_roi_percentage']
+    payback_years = roi_analysis['payback_period_years']
+    
+    # Build the DataFrame column-wise from the grid arrays; copy=False wraps
+    # the flattened buffers instead of duplicating them
+    sensitivity_df = pd.DataFrame({
+        'admin_efficiency': admin_eff.ravel(),
+        'cost_multiplier': cost_mult.ravel(),
+        'annual_savings_trillion': annual_savings.ravel() / 1e12,
+        'roi_percentage': roi_percentage.ravel(),
+        'payback_years': pd.array(payback_years.ravel(), dtype='Int64')
+    }, copy=False)
     
     print("\n📊 Sensitivity Analysis Results:")
     print(f"Annual Savings Range: ¥{sensitivity_df['annual_savings_trillion'].min():.2f}T - ¥{sensitivity_df['annual_savings_trillion'].max():.2f}T")
     print(f"ROI Range: {sensitivity_df['roi_percentage'].min():.1f}% - {sensitivity_df['roi_percentage'].max():.1f}%")
-    print(f"Payback Range: {sensitivity_df['payback_years'].min():.0f} - {sensitivity_df['payback_years'].max():.0f} years")
+    payback = sensitivity_df['payback_years'].dropna()
+    if len(payback):
+        print(f"Payback Range: {payback.min():.0f} - {payback.max():.0f} years")
+    else:
+        print("Payback Range: n/a (no combination pays back within the analysis period)")
     
     return sensitivity_df
 
@@ -146,8 +154,6 @@ def create_custom_visualizations(scenario_results):
     """Create custom visualizations for scenario comparison."""
     print("\n🎨 Creating Custom Visualizations...")
     
-    import matplotlib.pyplot as plt
-    
     # Extract data for comparison chart
     scenarios = list(scenario_results.keys())
     savings_data = [scenario_results[s]['summary']['total_annual_savings_trillion_yen'] for s in scenarios]
@@ -163,10 +169,7 @@ def create_custom_visualizations(scenario_results):
     ax1.tick_params(axis='x', rotation=45)
     
     # Add value labels on bars
-    for bar, value in zip(bars1, savings_data):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.05,
-                f'¥{value:.2f}T', ha='center', va='bottom', fontweight='bold')
+    ax1.bar_label(bars1, labels=[f'¥{value:.2f}T' for value in savings_data], padding=3, fontweight='bold')
     
     # ROI comparison
     bars2 = ax2.bar(scenarios, roi_data, color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4'])
@@ -175,14 +178,11 @@ def create_custom_visualizations(scenario_results):
     ax2.tick_params(axis='x', rotation=45)
     
     # Add value labels on bars
-    for bar, value in zip(bars2, roi_data):
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height + 5,
-                f'{value:.0f}%', ha='center', va='bottom', fontweight='bold')
+    ax2.bar_label(bars2, labels=[f'{value:.0f}%' for value in roi_data], padding=3, fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('scenario_comparison.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.tight_layout()
+    fig.savefig('scenario_comparison.png', dpi=150, bbox_inches='tight')
+    plt.close(fig)
     
     print("✅ Scenario comparison chart saved as: scenario_comparison.png")
 
@@ -191,11 +191,16 @@ def main():
     print("🔧 MCP-Health: Custom Analysis Example")
     print("=" * 70)
     
+    # Generate base data once, shared by every analysis below; the generator's
+    # default float32 profile already stores it compactly
+    generator = HealthcareDataGenerator(random_seed=42)
+    datasets = generator.load_or_generate_datasets()
+    
     # 1. Multi-scenario analysis
-    scenario_results = create_scenario_analysis()
+    scenario_results = create_scenario_analysis(datasets)
     
     # 2. Sensitivity analysis
-    sensitivity_df = create_sensitivity_analysis()
+    sensitivity_df = create_sensitivity_analysis(datasets)
     
     # 3. Custom visualizations
     create_custom_visualizations(scenario_results)
@@ -215,12 +220,13 @@ def main():
             'throughput_increase': report['summary']['throughput_increase_percentage']
         }
     
-    import json
-    with open('scenario_analysis_results.json', 'w') as f:
-        json.dump(scenario_summary, f, indent=2)
+    import orjson
+    with open('scenario_analysis_results.json', 'wb') as f:
+        f.write(orjson.dumps(scenario_summary, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2))
     
-    # Save sensitivity analysis
-    sensitivity_df.to_csv('sensitivity_analysis.csv', index=False)
+    # Save sensitivity analysis (fixed '\n' line endings keep the file
+    # byte-identical across platforms)
+    sensitivity_df.to_csv('sensitivity_analysis.csv', index=False, lineterminator='\n')
     
     print("✅ Results saved:")
     print("   • scenario_analysis_results.json")
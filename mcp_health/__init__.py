@@ -10,12 +10,27 @@ __author__ = "Tatsuru Kikuchi"
 __email__ = "tatsuru.kikuchi@example.com"
 __description__ = "AI Productivity Analysis for Medical Fees in Japan"
 
-from .core.data_analysis import HealthcareProductivityAnalyzer
-from .core.data_generator import HealthcareDataGenerator
-from .core.visualization import HealthcareVisualizer
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .core.data_analysis import HealthcareProductivityAnalyzer
+    from .core.data_generator import HealthcareDataGenerator
+    from .core.visualization import HealthcareVisualizer
+
+# Public classes are imported on first access (PEP 562) so that
+# `import mcp_health` does not pull in pandas or matplotlib up front
+_LAZY_IMPORTS = {
+    "HealthcareProductivityAnalyzer": ".core.data_analysis",
+    "HealthcareDataGenerator": ".core.data_generator",
+    "HealthcareVisualizer": ".core.visualization",
+}
 
 __all__ = [
     "HealthcareProductivityAnalyzer",
     "HealthcareDataGenerator", 
     "HealthcareVisualizer"
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS, globals())
\ No newline at end of file
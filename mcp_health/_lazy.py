@@ -0,0 +1,31 @@
+"""Lazy attribute imports for package __init__ modules (PEP 562)."""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, imports: Dict[str, str],
+                 namespace: Dict[str, Any]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the module-level `__getattr__` and `__dir__` of a package.
+    
+    Args:
+        package: The package's `__name__`, used to resolve relative modules
+        imports: Attribute names mapped to the (relative) module defining them
+        namespace: The package's `globals()`; imported attributes are cached
+            there so later lookups skip `__getattr__`
+        
+    Returns:
+        Tuple of the `__getattr__` and `__dir__` functions
+    """
+    def __getattr__(name: str) -> Any:
+        if name in imports:
+            module = importlib.import_module(imports[name], package)
+            value = getattr(module, name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(namespace.get('__all__', ())))
+    
+    return __getattr__, __dir__
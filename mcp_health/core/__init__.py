@@ -1 +1,25 @@
-\"\"\"Core modules for healthcare productivity analysis.\"\"\"\n\nfrom .data_analysis import HealthcareProductivityAnalyzer\nfrom .data_generator import HealthcareDataGenerator\nfrom .visualization import HealthcareVisualizer\n\n__all__ = [\n    \"HealthcareProductivityAnalyzer\",\n    \"HealthcareDataGenerator\",\n    \"HealthcareVisualizer\"\n]
\ No newline at end of file
+"""Core modules for healthcare productivity analysis."""
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .data_analysis import HealthcareProductivityAnalyzer
+    from .data_generator import HealthcareDataGenerator
+    from .visualization import HealthcareVisualizer
+
+# Imported on first access, see mcp_health/__init__.py
+_LAZY_IMPORTS = {
+    "HealthcareProductivityAnalyzer": ".data_analysis",
+    "HealthcareDataGenerator": ".data_generator",
+    "HealthcareVisualizer": ".visualization",
+}
+
+__all__ = [
+    "HealthcareProductivityAnalyzer",
+    "HealthcareDataGenerator",
+    "HealthcareVisualizer"
+]
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS, globals())
\ No newline at end of file
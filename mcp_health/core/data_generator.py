@@ -7,24 +7,99 @@ Generates representative sample datasets for Japanese healthcare system analysis
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+import hashlib
 import os
 
+from ..data import constants
+from ..data.constants import POPULATION_WEIGHTS, PREFECTURES
+
+
+# Per-size (small, medium, large) means and standard deviations of the hospital
+# admin %, hours per patient, processing time and error rate, one metric per
+# row, and the (lower, upper) bounds each metric is clipped to
+_HOSPITAL_METRIC_MEANS = np.array([
+    [0.018, 0.016, 0.014],
+    [2.2, 2.0, 1.8],
+    [4.5, 4.0, 3.5],
+    [0.028, 0.025, 0.022]
+])
+_HOSPITAL_METRIC_STDS = np.array([
+    [0.004, 0.003, 0.002],
+    [0.6, 0.5, 0.4],
+    [1.2, 1.0, 0.8],
+    [0.008, 0.006, 0.005]
+])
+_HOSPITAL_METRIC_BOUNDS = np.array([
+    [0.008, 0.030],
+    [0.5, 5.0],
+    [1.0, 8.0],
+    [0.005, 0.050]
+])
+
 
 class HealthcareDataGenerator:
     """Generator for sample healthcare datasets."""
     
-    def __init__(self, output_dir: str = "data/", random_seed: int = 42):
+    # Names of the datasets produced by generate_all_datasets
+    dataset_names = (
+        'medical_expenditure',
+        'workforce',
+        'administrative_costs',
+        'patient_volume',
+        'ai_implementation_costs'
+    )
+    
+    # Datasets generated together from one random stream by generate_all_datasets;
+    # patient volumes are derived from the workforce frame, so they share a group
+    _dataset_groups = (
+        ('medical_expenditure',),
+        ('workforce', 'patient_volume'),
+        ('administrative_costs',),
+        ('ai_implementation_costs',)
+    )
+    
+    _dataset_methods = {
+        'medical_expenditure': 'generate_medical_expenditure_data',
+        'workforce': 'generate_workforce_data',
+        'administrative_costs': 'generate_administrative_costs_data',
+        'patient_volume': 'generate_patient_volume_data',
+        'ai_implementation_costs': 'generate_ai_implementation_costs'
+    }
+    
+    # Yen amounts keep float64 under the float32 profile: at the ¥45 trillion
+    # scale float32 only resolves steps of a few million yen
+    _float64_columns = frozenset({
+        'total_expenditure', 'admin_expenditure', 'clinical_expenditure',
+        'error_related_costs', 'other_costs',
+        'upfront_cost', 'annual_maintenance', 'training_cost'
+    })
+    
+    def __init__(self, output_dir: str = "data/", random_seed: int = 42,
+                 dtype_profile: str = 'float32'):
         """Initialize the data generator.
         
         Args:
             output_dir: Directory to save generated datasets
             random_seed: Random seed for reproducible data generation
+            dtype_profile: 'float32' to store generate_all_datasets output as
+                float32/int32 columns (yen amounts stay float64), or 'float64'
+                to keep full-width columns
         """
+        if dtype_profile not in ('float32', 'float64'):
+            raise ValueError(f"Unknown dtype profile: {dtype_profile}. Available profiles: ['float32', 'float64']")
+        
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        np.random.seed(random_seed)
+        self.random_seed = random_seed
+        self.dtype_profile = dtype_profile
+        self.rng = np.random.default_rng(random_seed)
+        
+        # Last workforce frame generated, reused by generate_patient_volume_data
+        self._workforce_df = None
         
         # Japan-specific healthcare constants
         self.japan_data = {
@@ -36,168 +111,135 @@ class HealthcareDataGenerator:
             'clinics_count': 102000
         }
     
+    def invalidate_cache(self) -> None:
+        """Forget the cached workforce frame.
+        
+        generate_patient_volume_data reuses the frame from the last
+        generate_workforce_data call on this instance. Call this after
+        replacing `rng` so the next patient volume dataset is derived from
+        workforce data drawn from the new stream instead.
+        """
+        self._workforce_df = None
+    
     def generate_medical_expenditure_data(self) -> pd.DataFrame:
         """Generate medical expenditure data."""
-        years = list(range(2019, 2024))
-        
-        data = []
+        years = np.arange(2019, 2024)
         base_expenditure = 42e12  # Starting from ¥42 trillion in 2019
         
-        for i, year in enumerate(years):
-            # 2-3% annual growth in healthcare costs
-            growth_rate = np.random.normal(0.025, 0.005)
-            total_exp = base_expenditure * ((1 + growth_rate) ** i)
-            
-            # Administrative costs (1.6% of total)
-            admin_exp = total_exp * 0.016
-            
-            # Clinical operations (78% of total)
-            clinical_exp = total_exp * 0.78
-            
-            # Error-related costs (estimated 4.7% of total)
-            error_costs = total_exp * 0.047
-            
-            # Other costs
-            other_costs = total_exp - admin_exp - clinical_exp - error_costs
-            
-            data.append({
-                'year': year,
-                'total_expenditure': total_exp,
-                'admin_expenditure': admin_exp,
-                'clinical_expenditure': clinical_exp,
-                'error_related_costs': error_costs,
-                'other_costs': other_costs
-            })
-        
-        return pd.DataFrame(data)
+        # 2-3% annual growth in healthcare costs, compounded year over year
+        # from the 2019 base year
+        growth_rate = self.rng.normal(0.025, 0.005, len(years) - 1)
+        growth_multiplier = np.concatenate(([1.0], np.cumprod(1 + growth_rate)))
+        total_exp = base_expenditure * growth_multiplier
+        
+        # Administrative costs (1.6% of total)
+        admin_exp = total_exp * 0.016
+        
+        # Clinical operations (78% of total)
+        clinical_exp = total_exp * 0.78
+        
+        # Error-related costs (estimated 4.7% of total)
+        error_costs = total_exp * 0.047
+        
+        # Other costs
+        other_costs = total_exp - admin_exp - clinical_exp - error_costs
+        
+        return pd.DataFrame({
+            'year': years,
+            'total_expenditure': total_exp,
+            'admin_expenditure': admin_exp,
+            'clinical_expenditure': clinical_exp,
+            'error_related_costs': error_costs,
+            'other_costs': other_costs
+        }, copy=False)
     
     def generate_workforce_data(self) -> pd.DataFrame:
         """Generate healthcare workforce data by prefecture."""
-        prefectures = [
-            'Hokkaido', 'Aomori', 'Iwate', 'Miyagi', 'Akita', 'Yamagata', 'Fukushima',
-            'Ibaraki', 'Tochigi', 'Gunma', 'Saitama', 'Chiba', 'Tokyo', 'Kanagawa',
-            'Niigata', 'Toyama', 'Ishikawa', 'Fukui', 'Yamanashi', 'Nagano', 'Gifu',
-            'Shizuoka', 'Aichi', 'Mie', 'Shiga', 'Kyoto', 'Osaka', 'Hyogo', 'Nara',
-            'Wakayama', 'Tottori', 'Shimane', 'Okayama', 'Hiroshima', 'Yamaguchi',
-            'Tokushima', 'Kagawa', 'Ehime', 'Kochi', 'Fukuoka', 'Saga', 'Nagasaki',
-            'Kumamoto', 'Oita', 'Miyazaki', 'Kagoshima', 'Okinawa'
-        ]
+        # Scale workforce based on population, with some random variation
+        base_workers = (POPULATION_WEIGHTS * 30000).astype(int)  # Base workers per prefecture
+        total_workers = self.rng.normal(base_workers, base_workers * 0.15).astype(int)
         
-        # Population data (roughly proportional to actual prefecture populations)
-        population_weights = np.array([
-            5.2, 1.3, 1.2, 2.3, 1.0, 1.1, 1.9, 2.9, 2.0, 2.0, 7.3, 6.3, 14.0, 9.2,
-            2.3, 1.1, 1.2, 0.8, 0.8, 2.1, 2.0, 3.7, 7.5, 1.8, 1.4, 2.6, 8.8, 5.5, 1.4,
-            1.0, 0.6, 0.7, 1.9, 2.8, 1.4, 0.8, 1.0, 1.4, 0.7, 5.1, 0.8, 1.4, 1.8, 1.2,
-            1.1, 1.6, 1.5
-        ])
-        
-        data = []
-        for i, prefecture in enumerate(prefectures):
-            # Scale workforce based on population
-            base_workers = int(population_weights[i] * 30000)  # Base workers per prefecture
-            
-            # Add some random variation
-            total_workers = int(np.random.normal(base_workers, base_workers * 0.15))
-            
-            # Distribution of worker types
-            doctors = int(total_workers * np.random.normal(0.15, 0.02))  # ~15% doctors
-            nurses = int(total_workers * np.random.normal(0.45, 0.05))   # ~45% nurses
-            admin_workers = int(total_workers * np.random.normal(0.20, 0.03))  # ~20% admin
-            other_clinical = total_workers - doctors - nurses - admin_workers
-            
-            data.append({
-                'prefecture_id': i + 1,
-                'prefecture_name': prefecture,
-                'total_workers': total_workers,
-                'doctors': max(doctors, 0),
-                'nurses': max(nurses, 0),
-                'administrative_workers': max(admin_workers, 0),
-                'other_clinical_workers': max(other_clinical, 0),
-                'workers_per_1000_population': total_workers / (population_weights[i] * 1000)
-            })
-        
-        return pd.DataFrame(data)
+        # Distribution of worker types
+        n_prefectures = len(PREFECTURES)
+        doctors = (total_workers * self.rng.normal(0.15, 0.02, n_prefectures)).astype(int)  # ~15% doctors
+        nurses = (total_workers * self.rng.normal(0.45, 0.05, n_prefectures)).astype(int)   # ~45% nurses
+        admin_workers = (total_workers * self.rng.normal(0.20, 0.03, n_prefectures)).astype(int)  # ~20% admin
+        other_clinical = total_workers - doctors - nurses - admin_workers
+        
+        self._workforce_df = pd.DataFrame({
+            'prefecture_id': np.arange(1, n_prefectures + 1),
+            'prefecture_name': pd.Categorical(PREFECTURES, categories=PREFECTURES),
+            'total_workers': total_workers,
+            'doctors': np.maximum(doctors, 0),
+            'nurses': np.maximum(nurses, 0),
+            'administrative_workers': np.maximum(admin_workers, 0),
+            'other_clinical_workers': np.maximum(other_clinical, 0),
+            'workers_per_1000_population': total_workers / (POPULATION_WEIGHTS * 1000)
+        }, copy=False)
+        
+        return self._workforce_df
     
     def generate_administrative_costs_data(self) -> pd.DataFrame:
         """Generate hospital administrative costs data."""
         n_hospitals = 500  # Sample of hospitals
         
-        data = []
-        for hospital_id in range(1, n_hospitals + 1):
-            # Hospital size categories (affects admin percentage)
-            size_category = np.random.choice(['small', 'medium', 'large'], p=[0.6, 0.3, 0.1])
-            
-            if size_category == 'small':
-                beds = np.random.randint(20, 200)
-                admin_pct = np.random.normal(0.018, 0.004)  # Slightly higher admin % for small hospitals
-                hours_per_patient = np.random.normal(2.2, 0.6)
-                processing_time = np.random.normal(4.5, 1.2)
-                error_rate = np.random.normal(0.028, 0.008)
-            elif size_category == 'medium':
-                beds = np.random.randint(200, 500)
-                admin_pct = np.random.normal(0.016, 0.003)
-                hours_per_patient = np.random.normal(2.0, 0.5)
-                processing_time = np.random.normal(4.0, 1.0)
-                error_rate = np.random.normal(0.025, 0.006)
-            else:  # large
-                beds = np.random.randint(500, 1000)
-                admin_pct = np.random.normal(0.014, 0.002)  # Better efficiency in large hospitals
-                hours_per_patient = np.random.normal(1.8, 0.4)
-                processing_time = np.random.normal(3.5, 0.8)
-                error_rate = np.random.normal(0.022, 0.005)
-            
-            # Ensure realistic bounds
-            admin_pct = max(0.008, min(0.030, admin_pct))
-            hours_per_patient = max(0.5, min(5.0, hours_per_patient))
-            processing_time = max(1.0, min(8.0, processing_time))
-            error_rate = max(0.005, min(0.050, error_rate))
-            
-            data.append({
-                'hospital_id': hospital_id,
-                'size_category': size_category,
-                'bed_count': beds,
-                'admin_percentage': admin_pct,
-                'hours_per_patient': hours_per_patient,
-                'avg_processing_time': processing_time,
-                'error_rate': error_rate,
-                'monthly_patients': np.random.randint(1000, 10000),
-                'administrative_staff_count': max(5, int(beds * 0.15))
-            })
-        
-        return pd.DataFrame(data)
+        # Hospital size categories (affects admin percentage); every per-size
+        # parameter below is indexed by category so all hospitals are drawn at once
+        size_categories = ['small', 'medium', 'large']
+        category_idx = self.rng.choice(len(size_categories), size=n_hospitals, p=[0.6, 0.3, 0.1])
+        
+        beds = self.rng.integers(np.array([20, 200, 500])[category_idx],
+                                 np.array([200, 500, 1000])[category_idx])
+        # Admin %, hours per patient, processing time and error rate are drawn
+        # in one call: each row of the (4, n_hospitals) result is one metric,
+        # filled in the same order as four separate draws. Slightly higher
+        # admin % for small hospitals, better efficiency in large ones
+        metrics = self.rng.normal(_HOSPITAL_METRIC_MEANS[:, category_idx],
+                                  _HOSPITAL_METRIC_STDS[:, category_idx])
+        
+        # Ensure realistic bounds
+        admin_pct, hours_per_patient, processing_time, error_rate = np.clip(
+            metrics, _HOSPITAL_METRIC_BOUNDS[:, :1], _HOSPITAL_METRIC_BOUNDS[:, 1:], out=metrics
+        )
+        
+        return pd.DataFrame({
+            'hospital_id': np.arange(1, n_hospitals + 1),
+            'size_category': pd.Categorical.from_codes(category_idx, categories=size_categories),
+            'bed_count': beds,
+            'admin_percentage': admin_pct,
+            'hours_per_patient': hours_per_patient,
+            'avg_processing_time': processing_time,
+            'error_rate': error_rate,
+            'monthly_patients': self.rng.integers(1000, 10000, size=n_hospitals),
+            'administrative_staff_count': np.maximum(5, (beds * 0.15).astype(int))
+        }, copy=False)
     
     def generate_patient_volume_data(self) -> pd.DataFrame:
         """Generate patient volume data by prefecture."""
         # Use the same prefecture data as workforce
-        workforce_df = self.generate_workforce_data()
+        workforce_df = self._workforce_df if self._workforce_df is not None else self.generate_workforce_data()
+        n_prefectures = len(workforce_df)
         
-        data = []
-        for _, row in workforce_df.iterrows():
-            prefecture_id = row['prefecture_id']
-            prefecture_name = row['prefecture_name']
-            
-            # Estimate patient volume based on workers and population
-            base_patients = row['total_workers'] * 25  # Rough ratio
-            
-            # Add seasonal and random variation
-            annual_patients = int(np.random.normal(base_patients, base_patients * 0.1))
-            outpatient_visits = int(annual_patients * np.random.normal(6.5, 1.0))  # ~6.5 visits per patient per year
-            inpatient_admissions = int(annual_patients * np.random.normal(0.12, 0.02))  # ~12% admission rate
-            emergency_visits = int(annual_patients * np.random.normal(0.08, 0.015))  # ~8% emergency rate
-            
-            data.append({
-                'prefecture_id': prefecture_id,
-                'prefecture_name': prefecture_name,
-                'year': 2023,
-                'total_patients': annual_patients,
-                'outpatient_visits': outpatient_visits,
-                'inpatient_admissions': inpatient_admissions,
-                'emergency_visits': emergency_visits,
-                'average_length_of_stay': np.random.normal(16.5, 3.0),  # Days
-                'bed_occupancy_rate': np.random.normal(0.75, 0.08)  # 75% average
-            })
-        
-        return pd.DataFrame(data)
+        # Estimate patient volume based on workers and population
+        base_patients = workforce_df['total_workers'].to_numpy() * 25  # Rough ratio
+        
+        # Add seasonal and random variation
+        annual_patients = self.rng.normal(base_patients, base_patients * 0.1).astype(int)
+        outpatient_visits = (annual_patients * self.rng.normal(6.5, 1.0, n_prefectures)).astype(int)  # ~6.5 visits per patient per year
+        inpatient_admissions = (annual_patients * self.rng.normal(0.12, 0.02, n_prefectures)).astype(int)  # ~12% admission rate
+        emergency_visits = (annual_patients * self.rng.normal(0.08, 0.015, n_prefectures)).astype(int)  # ~8% emergency rate
+        
+        return pd.DataFrame({
+            'prefecture_id': workforce_df['prefecture_id'].to_numpy(),
+            'prefecture_name': workforce_df['prefecture_name'].array,
+            'year': 2023,
+            'total_patients': annual_patients,
+            'outpatient_visits': outpatient_visits,
+            'inpatient_admissions': inpatient_admissions,
+            'emergency_visits': emergency_visits,
+            'average_length_of_stay': self.rng.normal(16.5, 3.0, n_prefectures),  # Days
+            'bed_occupancy_rate': self.rng.normal(0.75, 0.08, n_prefectures)  # 75% average
+        }, copy=False)
     
     def generate_ai_implementation_costs(self) -> pd.DataFrame:
         """Generate AI implementation cost estimates."""
@@ -234,30 +276,110 @@ class HealthcareDataGenerator:
             }
         ]
         
-        return pd.DataFrame(phases)
+        return pd.DataFrame.from_records(phases)
     
-    def generate_all_datasets(self, save_to_disk: bool = True) -> Dict[str, pd.DataFrame]:
+    def generate_all_datasets(self, save_to_disk: bool = True,
+                              parallel: bool = False) -> Dict[str, pd.DataFrame]:
         """Generate all healthcare datasets.
         
+        Each dataset group draws from its own child stream spawned from
+        `rng`, so the result is the same whether or not the groups run in
+        parallel. Spawning advances `rng`, so repeated calls return new
+        draws; a fresh generator always starts from `random_seed`.
+        
         Args:
             save_to_disk: Whether to save datasets to CSV files
+            parallel: Generate the dataset groups in worker processes (ignored
+                on machines with two or fewer CPUs). Scripts using this must
+                guard their entry point with `if __name__ == "__main__":`
             
         Returns:
             Dictionary containing all generated datasets
         """
-        datasets = {
-            'medical_expenditure': self.generate_medical_expenditure_data(),
-            'workforce': self.generate_workforce_data(),
-            'administrative_costs': self.generate_administrative_costs_data(),
-            'patient_volume': self.generate_patient_volume_data(),
-            'ai_implementation_costs': self.generate_ai_implementation_costs()
-        }
+        streams = self.rng.spawn(len(self._dataset_groups))
+        tasks = [(str(self.output_dir), names, rng) for names, rng in zip(self._dataset_groups, streams)]
+        
+        if parallel and (os.cpu_count() or 1) > 2:
+            with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+                results = list(executor.map(_generate_dataset_group, *zip(*tasks)))
+        else:
+            results = [_generate_dataset_group(*task) for task in tasks]
+        
+        generated = {name: df for group in results for name, df in group.items()}
+        datasets = {name: self._apply_dtype_profile(generated[name]) for name in self.dataset_names}
         
         if save_to_disk:
+            self._save_datasets(datasets)
+        
+        return datasets
+    
+    def _save_datasets(self, datasets: Dict[str, pd.DataFrame]) -> None:
+        """Save datasets as CSV files in the output directory.
+        
+        Args:
+            datasets: Datasets keyed by name
+        """
+        for name, df in datasets.items():
+            filepath = self.output_dir / f"{name}.csv"
+            df.to_csv(filepath, index=False)
+            print(f"Saved {name} data to {filepath}")
+    
+    def _apply_dtype_profile(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Narrow 64-bit numeric columns according to `dtype_profile`.
+        
+        Args:
+            df: Generated dataset
+            
+        Returns:
+            Dataset with float32/int32 columns, or unchanged for 'float64'
+        """
+        if self.dtype_profile == 'float64':
+            return df
+        
+        narrow = {np.dtype(np.float64): np.float32, np.dtype(np.int64): np.int32}
+        dtypes = {
+            column: narrow[dtype]
+            for column, dtype in df.dtypes.items()
+            if dtype in narrow and column not in self._float64_columns
+        }
+        return df.astype(dtypes)
+    
+    def load_or_generate_datasets(self, cache_dir: Optional[str] = None,
+                                  save_to_disk: bool = False) -> Dict[str, pd.DataFrame]:
+        """Load datasets cached by a previous run, or generate and cache them.
+        
+        Generation is deterministic for a given seed, so the datasets a fresh
+        generator with this seed produces are pickled on the first call and
+        read back on later calls. Pickles are stored per code version (see
+        _cache_version), so changes to the generator or its libraries never
+        serve stale data. Delete the cache directory to force regeneration
+        or to remove old versions.
+        
+        Args:
+            cache_dir: Cache directory, relative to `output_dir` unless
+                absolute (defaults to `_cache_seed<seed>_<dtype_profile>`)
+            save_to_disk: Whether to also save CSV files, whether the
+                datasets were generated or read from the cache
+            
+        Returns:
+            Dictionary containing all datasets
+        """
+        cache_path = self.output_dir / (cache_dir or f"_cache_seed{self.random_seed}_{self.dtype_profile}") / _cache_version()
+        cache_files = {name: cache_path / f"{name}.pkl" for name in self.dataset_names}
+        
+        if all(filepath.exists() for filepath in cache_files.values()):
+            datasets = {name: pd.read_pickle(filepath) for name, filepath in cache_files.items()}
+        else:
+            # A fresh generator, since spawning streams advances self.rng
+            generator = HealthcareDataGenerator(str(self.output_dir), self.random_seed, self.dtype_profile)
+            datasets = generator.generate_all_datasets(save_to_disk=False)
+            
+            cache_path.mkdir(parents=True, exist_ok=True)
             for name, df in datasets.items():
-                filepath = self.output_dir / f"{name}.csv"
-                df.to_csv(filepath, index=False)
-                print(f"Saved {name} data to {filepath}")
+                df.to_pickle(cache_files[name])
+        
+        if save_to_disk:
+            self._save_datasets(datasets)
         
         return datasets
     
@@ -282,26 +404,59 @@ class HealthcareDataGenerator:
         report = analyzer.generate_analysis_report()
         
         if output_file:
-            import json
-            with open(output_file, 'w', encoding='utf-8') as f:
-                # Convert numpy types to Python types for JSON serialization
-                json_report = self._convert_numpy_types(report)
-                json.dump(json_report, f, indent=2, ensure_ascii=False)
+            import orjson
+            Path(output_file).write_bytes(orjson.dumps(
+                report,
+                default=self._json_default,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ))
             print(f"Analysis report saved to {output_file}")
         
         return report
     
-    def _convert_numpy_types(self, obj):
-        """Convert numpy types to Python types for JSON serialization."""
-        if isinstance(obj, dict):
-            return {key: self._convert_numpy_types(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_numpy_types(item) for item in obj]
-        elif isinstance(obj, np.integer):
-            return int(obj)
-        elif isinstance(obj, np.floating):
-            return float(obj)
+    @staticmethod
+    def _json_default(obj):
+        """Convert numpy values that orjson cannot serialize natively.
+        
+        Passed as `default=` to orjson.dumps, so it only sees the leaves
+        orjson does not already understand (e.g. non-contiguous arrays)
+        instead of walking the whole report.
+        """
+        if isinstance(obj, np.generic):
+            return obj.item()
         elif isinstance(obj, np.ndarray):
             return obj.tolist()
-        else:
-            return obj
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=None)
+def _cache_version() -> str:
+    """Short hash identifying the code that generates cached datasets.
+    
+    Covers the source of this module and of the shared reference constants,
+    and the numpy and pandas versions, which determine the random streams
+    and the pickle format.
+    """
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update(Path(constants.__file__).read_bytes())
+    digest.update(f"numpy {np.__version__} pandas {pd.__version__}".encode())
+    return digest.hexdigest()[:12]
+
+
+def _generate_dataset_group(output_dir: str, names: Tuple[str, ...],
+                            rng: np.random.Generator) -> Dict[str, pd.DataFrame]:
+    """Generate a group of datasets from one random stream.
+    
+    Module-level so it can be pickled for process pool workers.
+    
+    Args:
+        output_dir: Output directory of the calling generator
+        names: Dataset names, in generation order
+        rng: The group's random stream
+        
+    Returns:
+        Dictionary of the generated datasets
+    """
+    generator = HealthcareDataGenerator(output_dir=output_dir)
+    generator.rng = rng
+    return {name: getattr(generator, generator._dataset_methods[name])() for name in names}
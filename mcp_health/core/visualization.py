@@ -5,18 +5,74 @@ Healthcare Visualization Module
 Provides visualization tools for healthcare productivity analysis.
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any
 from pathlib import Path
+from contextlib import contextmanager
 import warnings
-warnings.filterwarnings('ignore')
 
-# Set style for professional plots
-plt.style.use('default')
-sns.set_palette("husl")
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Seaborn's 6-colour "husl" palette, hardcoded so plotting does not import seaborn
+_HUSL_PALETTE = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+
+# matplotlib.pyplot, imported and styled on first use by _plt() so that
+# importing this module stays cheap for callers that never plot
+plt = None
+
+
+def _plt():
+    """Import and style matplotlib.pyplot once, returning the module."""
+    global plt
+    if plt is None:
+        import matplotlib.pyplot as pyplot
+        from cycler import cycler
+        
+        # Set style for professional plots
+        pyplot.style.use('default')
+        pyplot.rcParams['axes.prop_cycle'] = cycler(color=_HUSL_PALETTE)
+        
+        # Simplify dense paths before rasterizing them
+        pyplot.rcParams.update({
+            'path.simplify': True,
+            'path.simplify_threshold': 1.0,
+            'agg.path.chunksize': 10000
+        })
+        plt = pyplot
+    return plt
+
+
+# savefig options for exported charts: 150 dpi is print quality at the figure
+# sizes used here, and zlib level 1 encodes PNGs several times faster than
+# the default level for slightly larger files
+_SAVEFIG_OPTIONS = {
+    'dpi': 150,
+    'bbox_inches': 'tight',
+    'pil_kwargs': {'compress_level': 1}
+}
+
+# Baseline/AI metrics compared by the charts, in bar order, and the factor
+# each is multiplied by for display (error rate as a percentage)
+_METRIC_KEYS = ('admin_hours_per_patient', 'processing_time_hours', 'billing_error_rate', 'cost_per_patient')
+_METRIC_SCALES = np.array([1.0, 1.0, 100.0, 1.0])
+
+# Columns of the yearly ROI analysis plotted by the charts
+_YEARLY_COLUMNS = ('year', 'savings', 'costs', 'cumulative_net', 'roi_percentage')
+
+
+@contextmanager
+def _missing_glyphs_ignored():
+    """Silence the missing-glyph warnings raised when drawing emoji text."""
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='Glyph .* missing from font', category=UserWarning)
+        yield
+
+
+def _extract(columns: Tuple[str, ...], rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Read columns of a list of records into float arrays, without building a DataFrame."""
+    return {column: np.fromiter((row[column] for row in rows), dtype=float, count=len(rows))
+            for column in columns}
 
 
 class HealthcareVisualizer:
@@ -43,26 +99,45 @@ class HealthcareVisualizer:
             'accent': '#9B59B6'       # Purple
         }
     
+    def _subplots(self, fig: Optional['Figure'], nrows: int, ncols: int,
+                  figsize: Tuple[int, int]) -> Tuple['Figure', Any]:
+        """Create a subplot grid, reusing `fig` (cleared and resized) if given."""
+        if fig is None:
+            return _plt().subplots(nrows, ncols, figsize=figsize)
+        
+        fig.clear()
+        fig.set_size_inches(figsize)
+        return fig, fig.subplots(nrows, ncols)
+    
+    def _compute_metric_arrays(self, baseline: Dict[str, float],
+                               ai_metrics: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the compared metric values and their improvements.
+        
+        Args:
+            baseline: Baseline metrics
+            ai_metrics: Metrics with AI implementation
+            
+        Returns:
+            Baseline values, AI values and percentage improvements, ordered
+            as `_METRIC_KEYS` with the error rate in percent
+        """
+        baseline_values = np.array([baseline[key] for key in _METRIC_KEYS]) * _METRIC_SCALES
+        ai_values = np.array([ai_metrics[key] for key in _METRIC_KEYS]) * _METRIC_SCALES
+        improvements = (1 - ai_values / baseline_values) * 100
+        return baseline_values, ai_values, improvements
+    
     def plot_cost_comparison(self, baseline: Dict[str, float], ai_metrics: Dict[str, float], 
-                           save_path: Optional[str] = None) -> plt.Figure:
+                           save_path: Optional[str] = None, fig: Optional['Figure'] = None,
+                           metric_arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> 'Figure':
         """Create cost comparison visualization."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._subplots(fig, 2, 2, figsize=(15, 12))
         fig.suptitle('Healthcare Cost Analysis: Baseline vs AI Implementation', fontsize=16, fontweight='bold')
         
         # 1. Key metrics comparison
         categories = ['Admin Hours\nper Patient', 'Processing Time\n(Hours)', 'Error Rate\n(%)', 'Cost per\nPatient (¥)']
-        baseline_values = [
-            baseline['admin_hours_per_patient'],
-            baseline['processing_time_hours'],
-            baseline['billing_error_rate'] * 100,
-            baseline['cost_per_patient']
-        ]
-        ai_values = [
-            ai_metrics['admin_hours_per_patient'],
-            ai_metrics['processing_time_hours'],
-            ai_metrics['billing_error_rate'] * 100,
-            ai_metrics['cost_per_patient']
-        ]
+        if metric_arrays is None:
+            metric_arrays = self._compute_metric_arrays(baseline, ai_metrics)
+        baseline_values, ai_values, improvements = metric_arrays
         
         x = np.arange(len(categories))
         width = 0.35
@@ -77,23 +152,13 @@ class HealthcareVisualizer:
         ax1.grid(True, alpha=0.3)
         
         # 2. Percentage improvements
-        improvements = [
-            (1 - ai_values[0]/baseline_values[0]) * 100,
-            (1 - ai_values[1]/baseline_values[1]) * 100,
-            (1 - ai_values[2]/baseline_values[2]) * 100,
-            (1 - ai_values[3]/baseline_values[3]) * 100
-        ]
-        
         bars = ax2.bar(categories, improvements, color=self.colors['savings'], alpha=0.8)
         ax2.set_title('Percentage Improvements with AI')
         ax2.set_ylabel('Improvement (%)')
-        ax2.set_ylim(0, max(improvements) * 1.1)
+        ax2.set_ylim(0, improvements.max() * 1.1)
         
         # Add value labels on bars
-        for bar, value in zip(bars, improvements):
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + max(improvements)*0.01,
-                    f'{value:.1f}%', ha='center', va='bottom', fontweight='bold')
+        ax2.bar_label(bars, labels=[f'{value:.1f}%' for value in improvements], padding=3, fontweight='bold')
         ax2.grid(True, alpha=0.3)
         
         # 3. Patient throughput comparison
@@ -117,20 +182,23 @@ class HealthcareVisualizer:
         ax4.tick_params(axis='x', rotation=45)
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, **_SAVEFIG_OPTIONS)
             print(f"Cost comparison plot saved to {save_path}")
         
         return fig
     
-    def plot_roi_analysis(self, roi_data: Dict[str, Any], save_path: Optional[str] = None) -> plt.Figure:
+    def plot_roi_analysis(self, roi_data: Dict[str, Any], save_path: Optional[str] = None,
+                          fig: Optional['Figure'] = None,
+                          yearly_data: Optional[Dict[str, np.ndarray]] = None) -> 'Figure':
         """Create ROI analysis visualization."""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._subplots(fig, 2, 2, figsize=(16, 12))
         fig.suptitle('Return on Investment (ROI) Analysis - 5 Year Projection', fontsize=16, fontweight='bold')
         
-        yearly_data = pd.DataFrame(roi_data['yearly_analysis'])
+        if yearly_data is None:
+            yearly_data = _extract(_YEARLY_COLUMNS, roi_data['yearly_analysis'])
         
         # 1. Cumulative savings over time
         ax1.plot(yearly_data['year'], yearly_data['cumulative_net'] / 1e12, 
@@ -151,17 +219,16 @@ class HealthcareVisualizer:
                     ha='center', va='center', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
         
         # 2. Annual ROI percentage
-        ax2.bar(yearly_data['year'], yearly_data['roi_percentage'], 
-               color=self.colors['ai_improved'], alpha=0.8)
+        bars = ax2.bar(yearly_data['year'], yearly_data['roi_percentage'], 
+                      color=self.colors['ai_improved'], alpha=0.8)
         ax2.set_title('ROI Percentage by Year')
         ax2.set_xlabel('Year')
         ax2.set_ylabel('ROI (%)')
         ax2.grid(True, alpha=0.3)
         
         # Add value labels on bars
-        for i, v in enumerate(yearly_data['roi_percentage']):
-            ax2.text(i+1, v + max(yearly_data['roi_percentage'])*0.02, f'{v:.0f}%', 
-                    ha='center', va='bottom', fontweight='bold')
+        ax2.bar_label(bars, labels=[f'{value:.0f}%' for value in yearly_data['roi_percentage']],
+                      padding=3, fontweight='bold')
         
         # 3. Savings vs Costs comparison
         ax3.bar(yearly_data['year'] - 0.2, yearly_data['savings'] / 1e12, width=0.4, 
@@ -175,35 +242,41 @@ class HealthcareVisualizer:
         ax3.grid(True, alpha=0.3)
         
         # 4. Investment summary (donut chart)
+        maintenance_costs = yearly_data['costs'].sum()
         investment_data = {
-            'Initial Investment': roi_data['total_investment'] - (yearly_data['costs'].sum()),
-            'Maintenance Costs': yearly_data['costs'].sum(),
+            'Initial Investment': roi_data['total_investment'] - maintenance_costs,
+            'Maintenance Costs': maintenance_costs,
             'Net Benefit': roi_data['net_benefit']
         }
         
+        # Wedge labels show yen amounts; the total is summed once, not per wedge
+        investment_total = sum(investment_data.values())
         colors_investment = [self.colors['costs'], self.colors['neutral'], self.colors['savings']]
         wedges, texts, autotexts = ax4.pie(investment_data.values(), labels=investment_data.keys(), 
-                                          autopct=lambda pct: f'¥{pct*sum(investment_data.values())/100/1e12:.1f}T',
+                                          autopct=lambda pct: f'¥{pct*investment_total/100/1e12:.1f}T',
                                           colors=colors_investment, startangle=90)
         
         # Create donut chart
-        centre_circle = plt.Circle((0,0), 0.50, fc='white')
+        centre_circle = _plt().Circle((0,0), 0.50, fc='white')
         ax4.add_artist(centre_circle)
         ax4.text(0, 0, f'Total ROI\n{roi_data["total_roi_percentage"]:.0f}%', 
                 ha='center', va='center', fontsize=14, fontweight='bold')
         ax4.set_title('5-Year Investment Breakdown')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, **_SAVEFIG_OPTIONS)
             print(f"ROI analysis plot saved to {save_path}")
         
         return fig
     
-    def create_summary_dashboard(self, analysis_report: Dict[str, Any], save_path: Optional[str] = None) -> plt.Figure:
+    def create_summary_dashboard(self, analysis_report: Dict[str, Any], save_path: Optional[str] = None,
+                                 fig: Optional['Figure'] = None,
+                                 yearly_data: Optional[Dict[str, np.ndarray]] = None,
+                                 metric_arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None) -> 'Figure':
         """Create a comprehensive summary dashboard."""
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+        fig, axes = self._subplots(fig, 2, 3, figsize=(18, 12))
         fig.suptitle('MCP-Health: AI Impact Analysis Summary Dashboard', fontsize=16, fontweight='bold')
         
         # Flatten axes for easier indexing
@@ -217,10 +290,12 @@ class HealthcareVisualizer:
         
         # 1. Key metrics comparison
         metrics = ['Admin Hours', 'Processing Time', 'Error Rate', 'Cost/Patient']
-        baseline_vals = [baseline['admin_hours_per_patient'], baseline['processing_time_hours'], 
-                        baseline['billing_error_rate']*100, baseline['cost_per_patient']/1000]
-        ai_vals = [ai_metrics['admin_hours_per_patient'], ai_metrics['processing_time_hours'],
-                  ai_metrics['billing_error_rate']*100, ai_metrics['cost_per_patient']/1000]
+        if metric_arrays is None:
+            metric_arrays = self._compute_metric_arrays(baseline, ai_metrics)
+        # Cost per patient is shown in thousands of yen
+        dashboard_scales = np.array([1, 1, 1, 1000])
+        baseline_vals = metric_arrays[0] / dashboard_scales
+        ai_vals = metric_arrays[1] / dashboard_scales
         
         x = np.arange(len(metrics))
         width = 0.35
@@ -243,7 +318,7 @@ class HealthcareVisualizer:
         
         # 3. ROI progression
         if 'roi_analysis' in analysis_report:
-            roi_data = pd.DataFrame(analysis_report['roi_analysis']['yearly_analysis'])
+            roi_data = yearly_data if yearly_data is not None else _extract(('year', 'roi_percentage'), analysis_report['roi_analysis']['yearly_analysis'])
             axes[2].plot(roi_data['year'], roi_data['roi_percentage'], marker='o', linewidth=3, 
                         color=self.colors['savings'])
             axes[2].set_title('ROI Progression (%)')
@@ -262,10 +337,7 @@ class HealthcareVisualizer:
         axes[3].set_ylabel('Improvement (%)')
         
         # Add value labels
-        for bar, value in zip(bars, improvement_values):
-            height = bar.get_height()
-            axes[3].text(bar.get_x() + bar.get_width()/2., height + 1,
-                        f'{value:.0f}%', ha='center', va='bottom', fontweight='bold')
+        axes[3].bar_label(bars, labels=[f'{value:.0f}%' for value in improvement_values], padding=3, fontweight='bold')
         axes[3].grid(True, alpha=0.3)
         
         # 5. Cost comparison
@@ -304,11 +376,13 @@ class HealthcareVisualizer:
         axes[5].text(0.1, 0.9, summary_text, transform=axes[5].transAxes, fontsize=11,
                     verticalalignment='top', bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.3))
         
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"Summary dashboard saved to {save_path}")
+        # The summary text's emoji are not in the default font
+        with _missing_glyphs_ignored():
+            fig.tight_layout()
+            
+            if save_path:
+                fig.savefig(save_path, **_SAVEFIG_OPTIONS)
+                print(f"Summary dashboard saved to {save_path}")
         
         return fig
     
@@ -320,29 +394,45 @@ class HealthcareVisualizer:
         """
         chart_paths = {}
         
+        # One figure is cleared and redrawn for every chart, and the metric and
+        # yearly ROI arrays are computed once for both charts that plot them.
+        # Charts are saved one after another: savefig time is almost all Agg
+        # rendering, which holds the GIL, so saving separate figures from a
+        # thread pool is no faster (PNG encoding is already at zlib level 1)
+        plt = _plt()
+        fig = plt.figure()
+        metric_arrays = self._compute_metric_arrays(analysis_report['baseline_metrics'],
+                                                    analysis_report['ai_improved_metrics'])
+        yearly_data = None
+        if 'roi_analysis' in analysis_report:
+            yearly_data = _extract(_YEARLY_COLUMNS, analysis_report['roi_analysis']['yearly_analysis'])
+        
         # Cost comparison chart
-        fig1 = self.plot_cost_comparison(
+        self.plot_cost_comparison(
             analysis_report['baseline_metrics'], 
-            analysis_report['ai_improved_metrics']
+            analysis_report['ai_improved_metrics'],
+            fig=fig,
+            metric_arrays=metric_arrays
         )
         cost_path = self.output_dir / "cost_comparison.png"
-        fig1.savefig(cost_path, dpi=300, bbox_inches='tight')
+        fig.savefig(cost_path, **_SAVEFIG_OPTIONS)
         chart_paths['cost_comparison'] = str(cost_path)
-        plt.close(fig1)
         
         # ROI analysis chart
         if 'roi_analysis' in analysis_report:
-            fig2 = self.plot_roi_analysis(analysis_report['roi_analysis'])
+            self.plot_roi_analysis(analysis_report['roi_analysis'], fig=fig, yearly_data=yearly_data)
             roi_path = self.output_dir / "roi_analysis.png"
-            fig2.savefig(roi_path, dpi=300, bbox_inches='tight')
+            fig.savefig(roi_path, **_SAVEFIG_OPTIONS)
             chart_paths['roi_analysis'] = str(roi_path)
-            plt.close(fig2)
         
         # Summary dashboard
-        fig3 = self.create_summary_dashboard(analysis_report)
+        self.create_summary_dashboard(analysis_report, fig=fig, yearly_data=yearly_data,
+                                      metric_arrays=metric_arrays)
         summary_path = self.output_dir / "summary_dashboard.png"
-        fig3.savefig(summary_path, dpi=300, bbox_inches='tight')
+        with _missing_glyphs_ignored():
+            fig.savefig(summary_path, **_SAVEFIG_OPTIONS)
         chart_paths['summary_dashboard'] = str(summary_path)
-        plt.close(fig3)
+        
+        plt.close(fig)
         
         return chart_paths
\ No newline at end of file
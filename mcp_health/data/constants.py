@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Reference data shared by the data generator and the sample datasets.
+"""
+
+import numpy as np
+
+# Prefectures in JIS code order
+PREFECTURES = (
+    'Hokkaido', 'Aomori', 'Iwate', 'Miyagi', 'Akita', 'Yamagata', 'Fukushima',
+    'Ibaraki', 'Tochigi', 'Gunma', 'Saitama', 'Chiba', 'Tokyo', 'Kanagawa',
+    'Niigata', 'Toyama', 'Ishikawa', 'Fukui', 'Yamanashi', 'Nagano', 'Gifu',
+    'Shizuoka', 'Aichi', 'Mie', 'Shiga', 'Kyoto', 'Osaka', 'Hyogo', 'Nara',
+    'Wakayama', 'Tottori', 'Shimane', 'Okayama', 'Hiroshima', 'Yamaguchi',
+    'Tokushima', 'Kagawa', 'Ehime', 'Kochi', 'Fukuoka', 'Saga', 'Nagasaki',
+    'Kumamoto', 'Oita', 'Miyazaki', 'Kagoshima', 'Okinawa'
+)
+
+# Population data (roughly proportional to actual prefecture populations)
+POPULATION_WEIGHTS = np.array([
+    5.2, 1.3, 1.2, 2.3, 1.0, 1.1, 1.9, 2.9, 2.0, 2.0, 7.3, 6.3, 14.0, 9.2,
+    2.3, 1.1, 1.2, 0.8, 0.8, 2.1, 2.0, 3.7, 7.5, 1.8, 1.4, 2.6, 8.8, 5.5, 1.4,
+    1.0, 0.6, 0.7, 1.9, 2.8, 1.4, 0.8, 1.0, 1.4, 0.7, 5.1, 0.8, 1.4, 1.8, 1.2,
+    1.1, 1.6, 1.5
+], dtype=np.float64)
+POPULATION_WEIGHTS.setflags(write=False)
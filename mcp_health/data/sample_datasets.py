@@ -7,7 +7,13 @@ Provides sample datasets for testing and demonstration purposes.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict
+
+from .constants import POPULATION_WEIGHTS, PREFECTURES
+
+# Seed of the sample data random streams, for reproducible data
+_SAMPLE_SEED = 42
 
 # Information about available sample datasets
 SAMPLE_DATA_INFO = {
@@ -41,164 +47,128 @@ SAMPLE_DATA_INFO = {
 def get_sample_data(dataset_name: str = None) -> Dict[str, pd.DataFrame]:
     """Get sample healthcare datasets.
     
+    Each dataset is built once per process and drawn from its own seeded
+    random stream, so it is identical whether requested alone or with the
+    others. Callers receive copies and may modify them freely.
+    
     Args:
         dataset_name: Name of specific dataset to load, or None for all datasets
         
     Returns:
         Dictionary containing requested dataset(s)
     """
-    np.random.seed(42)  # For reproducible data
-    
-    datasets = {
-        'medical_expenditure': _create_medical_expenditure_data(),
-        'workforce': _create_workforce_data(),
-        'administrative_costs': _create_administrative_costs_data(),
-        'patient_volume': _create_patient_volume_data(),
-        'ai_implementation_costs': _create_ai_costs_data()
-    }
-    
     if dataset_name:
-        if dataset_name in datasets:
-            return {dataset_name: datasets[dataset_name]}
-        else:
-            raise ValueError(f"Unknown dataset: {dataset_name}. Available datasets: {list(datasets.keys())}")
+        if dataset_name not in _DATASET_BUILDERS:
+            raise ValueError(f"Unknown dataset: {dataset_name}. Available datasets: {list(_DATASET_BUILDERS.keys())}")
+        return {dataset_name: _DATASET_BUILDERS[dataset_name]().copy()}
     
-    return datasets
+    return {name: builder().copy() for name, builder in _DATASET_BUILDERS.items()}
 
+def _rng(dataset_name: str) -> np.random.Generator:
+    """Create the reproducible random stream of one dataset."""
+    return np.random.default_rng([_SAMPLE_SEED, list(SAMPLE_DATA_INFO).index(dataset_name)])
+
+@lru_cache(maxsize=1)
 def _create_medical_expenditure_data() -> pd.DataFrame:
     """Create sample medical expenditure data."""
-    years = list(range(2019, 2024))
-    data = []
+    years = np.arange(2019, 2024)
     base_expenditure = 42e12  # Starting from ¥42 trillion in 2019
+    growth_rate = 0.025  # 2.5% annual growth
+    total_exp = base_expenditure * (1 + growth_rate) ** np.arange(len(years))
     
-    for i, year in enumerate(years):
-        growth_rate = 0.025  # 2.5% annual growth
-        total_exp = base_expenditure * ((1 + growth_rate) ** i)
-        
-        data.append({
-            'year': year,
-            'total_expenditure': total_exp,
-            'admin_expenditure': total_exp * 0.016,
-            'clinical_expenditure': total_exp * 0.78,
-            'error_related_costs': total_exp * 0.047,
-            'other_costs': total_exp * 0.157
-        })
-    
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'year': years,
+        'total_expenditure': total_exp,
+        'admin_expenditure': total_exp * 0.016,
+        'clinical_expenditure': total_exp * 0.78,
+        'error_related_costs': total_exp * 0.047,
+        'other_costs': total_exp * 0.157
+    })
 
+@lru_cache(maxsize=1)
 def _create_workforce_data() -> pd.DataFrame:
     """Create sample workforce data."""
-    prefectures = [
-        'Hokkaido', 'Aomori', 'Iwate', 'Miyagi', 'Akita', 'Yamagata', 'Fukushima',
-        'Ibaraki', 'Tochigi', 'Gunma', 'Saitama', 'Chiba', 'Tokyo', 'Kanagawa',
-        'Niigata', 'Toyama', 'Ishikawa', 'Fukui', 'Yamanashi', 'Nagano', 'Gifu',
-        'Shizuoka', 'Aichi', 'Mie', 'Shiga', 'Kyoto', 'Osaka', 'Hyogo', 'Nara',
-        'Wakayama', 'Tottori', 'Shimane', 'Okayama', 'Hiroshima', 'Yamaguchi',
-        'Tokushima', 'Kagawa', 'Ehime', 'Kochi', 'Fukuoka', 'Saga', 'Nagasaki',
-        'Kumamoto', 'Oita', 'Miyazaki', 'Kagoshima', 'Okinawa'
-    ]
+    rng = _rng('workforce')
+    base_workers = (POPULATION_WEIGHTS * 30000).astype(int)
+    total_workers = rng.normal(base_workers, base_workers * 0.1).astype(int)
     
-    # Population weights (roughly proportional to actual prefecture populations)
-    population_weights = np.array([
-        5.2, 1.3, 1.2, 2.3, 1.0, 1.1, 1.9, 2.9, 2.0, 2.0, 7.3, 6.3, 14.0, 9.2,
-        2.3, 1.1, 1.2, 0.8, 0.8, 2.1, 2.0, 3.7, 7.5, 1.8, 1.4, 2.6, 8.8, 5.5, 1.4,
-        1.0, 0.6, 0.7, 1.9, 2.8, 1.4, 0.8, 1.0, 1.4, 0.7, 5.1, 0.8, 1.4, 1.8, 1.2,
-        1.1, 1.6, 1.5
-    ])
+    doctors = (total_workers * 0.15).astype(int)
+    nurses = (total_workers * 0.45).astype(int)
+    admin_workers = (total_workers * 0.20).astype(int)
+    other_clinical = total_workers - doctors - nurses - admin_workers
     
-    data = []
-    for i, prefecture in enumerate(prefectures):
-        base_workers = int(population_weights[i] * 30000)
-        total_workers = int(np.random.normal(base_workers, base_workers * 0.1))
-        
-        doctors = int(total_workers * 0.15)
-        nurses = int(total_workers * 0.45)
-        admin_workers = int(total_workers * 0.20)
-        other_clinical = total_workers - doctors - nurses - admin_workers
-        
-        data.append({
-            'prefecture_id': i + 1,
-            'prefecture_name': prefecture,
-            'total_workers': total_workers,
-            'doctors': doctors,
-            'nurses': nurses,
-            'administrative_workers': admin_workers,
-            'other_clinical_workers': max(0, other_clinical),
-            'workers_per_1000_population': total_workers / (population_weights[i] * 1000)
-        })
-    
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'prefecture_id': np.arange(1, len(PREFECTURES) + 1),
+        'prefecture_name': pd.Categorical(PREFECTURES, categories=PREFECTURES),
+        'total_workers': total_workers,
+        'doctors': doctors,
+        'nurses': nurses,
+        'administrative_workers': admin_workers,
+        'other_clinical_workers': np.maximum(0, other_clinical),
+        'workers_per_1000_population': total_workers / (POPULATION_WEIGHTS * 1000)
+    })
 
+@lru_cache(maxsize=1)
 def _create_administrative_costs_data() -> pd.DataFrame:
     """Create sample administrative costs data."""
+    rng = _rng('administrative_costs')
     n_hospitals = 500
-    data = []
     
-    for hospital_id in range(1, n_hospitals + 1):
-        size_category = np.random.choice(['small', 'medium', 'large'], p=[0.6, 0.3, 0.1])
-        
-        if size_category == 'small':
-            beds = np.random.randint(20, 200)
-            admin_pct = np.random.normal(0.018, 0.003)
-            hours_per_patient = np.random.normal(2.2, 0.5)
-            processing_time = np.random.normal(4.5, 1.0)
-            error_rate = np.random.normal(0.028, 0.006)
-        elif size_category == 'medium':
-            beds = np.random.randint(200, 500)
-            admin_pct = np.random.normal(0.016, 0.002)
-            hours_per_patient = np.random.normal(2.0, 0.4)
-            processing_time = np.random.normal(4.0, 0.8)
-            error_rate = np.random.normal(0.025, 0.005)
-        else:  # large
-            beds = np.random.randint(500, 1000)
-            admin_pct = np.random.normal(0.014, 0.002)
-            hours_per_patient = np.random.normal(1.8, 0.3)
-            processing_time = np.random.normal(3.5, 0.6)
-            error_rate = np.random.normal(0.022, 0.004)
-        
-        # Ensure realistic bounds
-        admin_pct = max(0.008, min(0.030, admin_pct))
-        hours_per_patient = max(0.5, min(5.0, hours_per_patient))
-        processing_time = max(1.0, min(8.0, processing_time))
-        error_rate = max(0.005, min(0.050, error_rate))
-        
-        data.append({
-            'hospital_id': hospital_id,
-            'size_category': size_category,
-            'bed_count': beds,
-            'admin_percentage': admin_pct,
-            'hours_per_patient': hours_per_patient,
-            'avg_processing_time': processing_time,
-            'error_rate': error_rate,
-            'monthly_patients': np.random.randint(1000, 10000),
-            'administrative_staff_count': max(5, int(beds * 0.15))
-        })
+    # Per-size parameters are indexed by category so all hospitals are drawn at once
+    size_categories = ['small', 'medium', 'large']
+    category_idx = rng.choice(len(size_categories), size=n_hospitals, p=[0.6, 0.3, 0.1])
     
-    return pd.DataFrame(data)
+    beds = rng.integers(np.array([20, 200, 500])[category_idx],
+                        np.array([200, 500, 1000])[category_idx])
+    # Admin %, hours per patient, processing time and error rate are drawn in
+    # one call, one metric per row of the (4, n_hospitals) result and in the
+    # same order as four separate draws
+    means = np.array([[0.018, 0.016, 0.014], [2.2, 2.0, 1.8], [4.5, 4.0, 3.5], [0.028, 0.025, 0.022]])
+    stds = np.array([[0.003, 0.002, 0.002], [0.5, 0.4, 0.3], [1.0, 0.8, 0.6], [0.006, 0.005, 0.004]])
+    metrics = rng.normal(means[:, category_idx], stds[:, category_idx])
+    
+    # Ensure realistic bounds
+    bounds = np.array([[0.008, 0.030], [0.5, 5.0], [1.0, 8.0], [0.005, 0.050]])
+    admin_pct, hours_per_patient, processing_time, error_rate = np.clip(
+        metrics, bounds[:, :1], bounds[:, 1:], out=metrics
+    )
+    
+    return pd.DataFrame({
+        'hospital_id': np.arange(1, n_hospitals + 1),
+        'size_category': pd.Categorical.from_codes(category_idx, categories=size_categories),
+        'bed_count': beds,
+        'admin_percentage': admin_pct,
+        'hours_per_patient': hours_per_patient,
+        'avg_processing_time': processing_time,
+        'error_rate': error_rate,
+        'monthly_patients': rng.integers(1000, 10000, size=n_hospitals),
+        'administrative_staff_count': np.maximum(5, (beds * 0.15).astype(int))
+    })
 
+@lru_cache(maxsize=1)
 def _create_patient_volume_data() -> pd.DataFrame:
     """Create sample patient volume data."""
+    rng = _rng('patient_volume')
+    # Cached, so the workforce frame is shared rather than regenerated
     workforce_df = _create_workforce_data()
+    n_prefectures = len(workforce_df)
     
-    data = []
-    for _, row in workforce_df.iterrows():
-        base_patients = row['total_workers'] * 25
-        annual_patients = int(np.random.normal(base_patients, base_patients * 0.1))
-        
-        data.append({
-            'prefecture_id': row['prefecture_id'],
-            'prefecture_name': row['prefecture_name'],
-            'year': 2023,
-            'total_patients': annual_patients,
-            'outpatient_visits': int(annual_patients * 6.5),
-            'inpatient_admissions': int(annual_patients * 0.12),
-            'emergency_visits': int(annual_patients * 0.08),
-            'average_length_of_stay': np.random.normal(16.5, 2.0),
-            'bed_occupancy_rate': np.random.normal(0.75, 0.05)
-        })
+    base_patients = workforce_df['total_workers'].to_numpy() * 25
+    annual_patients = rng.normal(base_patients, base_patients * 0.1).astype(int)
     
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'prefecture_id': workforce_df['prefecture_id'].to_numpy(),
+        'prefecture_name': workforce_df['prefecture_name'].array,
+        'year': 2023,
+        'total_patients': annual_patients,
+        'outpatient_visits': (annual_patients * 6.5).astype(int),
+        'inpatient_admissions': (annual_patients * 0.12).astype(int),
+        'emergency_visits': (annual_patients * 0.08).astype(int),
+        'average_length_of_stay': rng.normal(16.5, 2.0, n_prefectures),
+        'bed_occupancy_rate': rng.normal(0.75, 0.05, n_prefectures)
+    })
 
+@lru_cache(maxsize=1)
 def _create_ai_costs_data() -> pd.DataFrame:
     """Create sample AI implementation costs data."""
     phases = [
@@ -234,4 +204,13 @@ def _create_ai_costs_data() -> pd.DataFrame:
         }
     ]
     
-    return pd.DataFrame(phases)
+    return pd.DataFrame.from_records(phases)
+
+# Dataset constructors by name, in the order of SAMPLE_DATA_INFO
+_DATASET_BUILDERS = {
+    'medical_expenditure': _create_medical_expenditure_data,
+    'workforce': _create_workforce_data,
+    'administrative_costs': _create_administrative_costs_data,
+    'patient_volume': _create_patient_volume_data,
+    'ai_implementation_costs': _create_ai_costs_data
+}
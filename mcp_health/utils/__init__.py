@@ -1,5 +1,5 @@
 """Utility modules for MCP-Health package."""
 
-from .config import DEFAULT_CONFIG, load_config
+from .config import DEFAULT_CONFIG, DEFAULT_CONFIG_FROZEN, config_with, load_config
 
-__all__ = ["DEFAULT_CONFIG", "load_config"]
\ No newline at end of file
+__all__ = ["DEFAULT_CONFIG", "DEFAULT_CONFIG_FROZEN", "config_with", "load_config"]
\ No newline at end of file
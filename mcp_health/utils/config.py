@@ -3,12 +3,21 @@
 Configuration settings for MCP-Health package.
 """
 
-from typing import Dict, Any
-import json
+from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from functools import lru_cache
+from collections import deque
+import logging
+import mmap
+import os
 from pathlib import Path
 
+import orjson
+
+logger = logging.getLogger(__name__)
+
 # Default configuration for healthcare productivity analysis
-DEFAULT_CONFIG = {
+_DEFAULT_CONFIG = {
     # AI improvement factors (based on research literature)
     'ai_improvements': {
         'admin_efficiency_gain': 0.52,  # 52% reduction in admin time
@@ -83,6 +92,43 @@ DEFAULT_CONFIG = {
     }
 }
 
+def _freeze(value: Any) -> Any:
+    """Return a deeply read-only view: dicts become MappingProxyType, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _freeze: read-only mappings become dicts, tuples lists."""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
+
+# Read-only view of the defaults; use load_config() for a mutable copy
+DEFAULT_CONFIG = MappingProxyType(_DEFAULT_CONFIG)
+
+# Deeply read-only view of the defaults, safe to share without copying. Its
+# sections are MappingProxyType and its lists tuples; load_config() and
+# config_with() return mutable copies built from plain dicts and lists, the
+# same types a parsed config file has
+DEFAULT_CONFIG_FROZEN = _freeze(_DEFAULT_CONFIG)
+
+# The defaults serialized once; orjson.loads() of this blob builds a fresh
+# deep copy faster than copy.deepcopy() walks the dict tree
+_DEFAULT_BYTES = orjson.dumps(_DEFAULT_CONFIG)
+
+# Absolute directories save_config() has already created or found, so repeat
+# saves skip the mkdir call and its stat of every parent directory
+_KNOWN_DIRS = set()
+
+# Config files at least this large are parsed from a memory map instead of
+# being read into (and cached as) a bytes copy
+_MMAP_MIN_SIZE = 1 << 20
+
 def load_config(config_path: str = None) -> Dict[str, Any]:
     """Load configuration from file or return default config.
     
@@ -93,28 +139,140 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
         Configuration dictionary
     """
     if config_path is None:
-        return DEFAULT_CONFIG.copy()
+        return orjson.loads(_DEFAULT_BYTES)
     
     config_file = Path(config_path)
     
-    if not config_file.exists():
-        print(f"Config file {config_path} not found, using default configuration")
-        return DEFAULT_CONFIG.copy()
+    try:
+        stat = config_file.stat()
+    except OSError:
+        logger.warning("Config file %s not found, using default configuration", config_path)
+        return orjson.loads(_DEFAULT_BYTES)
     
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            user_config = json.load(f)
+        if stat.st_size >= _MMAP_MIN_SIZE:
+            user_config = _parse_mapped(config_file)
+        else:
+            user_config = orjson.loads(
+                _read_config_bytes(os.path.abspath(config_file), stat.st_mtime_ns, stat.st_size)
+            )
         
-        # Merge user config with defaults
-        config = DEFAULT_CONFIG.copy()
-        config.update(user_config)
+        if not isinstance(user_config, dict):
+            raise TypeError(f"config file must contain an object, got {type(user_config).__name__}")
         
+        # Merge user config with defaults; nested sections are merged key by
+        # key, so a file only needs the values it changes. Values of the
+        # wrong type are skipped, keeping their defaults
+        errors = []
+        config = _deep_merge(orjson.loads(_DEFAULT_BYTES), user_config, errors)
+        for error in errors:
+            logger.warning("Ignoring %s in config file %s", error, config_path)
         return config
         
     except Exception as e:
-        print(f"Error loading config file {config_path}: {e}")
-        print("Using default configuration")
-        return DEFAULT_CONFIG.copy()
+        logger.warning("Error loading config file %s: %s; using default configuration", config_path, e)
+        return orjson.loads(_DEFAULT_BYTES)
+
+def _is_compatible(default: Any, value: Any) -> bool:
+    """Check a config value has the JSON type of its default (ints and floats mix)."""
+    if isinstance(default, bool) or isinstance(value, bool):
+        return isinstance(default, bool) and isinstance(value, bool)
+    if isinstance(default, (int, float)):
+        return isinstance(value, (int, float))
+    return isinstance(value, type(default))
+
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any],
+                errors: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Merge `override` into `base` in place, recursing into nested dicts.
+    
+    Values in `override` replace those in `base` unless both are dicts, in
+    which case they are merged. Nesting is walked with an explicit stack
+    rather than recursive calls. The same pass validates `override` against
+    the types in `base`, so a malformed config file is caught at load time
+    rather than deep inside an analysis. Keys missing from `base` are kept
+    as given.
+    
+    Args:
+        base: Configuration to update
+        override: Configuration values to apply
+        errors: If given, values whose type differs from `base` are skipped
+            (keeping the `base` value) and described in this list instead of
+            raising
+        
+    Returns:
+        The updated `base`
+        
+    Raises:
+        TypeError: If a value in `override` has a different type than in
+            `base` and no `errors` list was given
+    """
+    stack = deque([(base, override, '')])
+    while stack:
+        base_node, override_node, prefix = stack.pop()
+        for key, value in override_node.items():
+            if key not in base_node:
+                base_node[key] = value
+                continue
+            current = base_node[key]
+            if isinstance(current, dict) and isinstance(value, dict):
+                stack.append((current, value, f"{prefix}{key}."))
+                continue
+            if not isinstance(current, dict) and _is_compatible(current, value):
+                base_node[key] = value
+                continue
+            expected = 'object' if isinstance(current, dict) else type(current).__name__
+            message = f"config key {prefix}{key} must be {expected}, got {type(value).__name__}"
+            if errors is None:
+                raise TypeError(message)
+            errors.append(message)
+    return base
+
+@lru_cache(maxsize=32)
+def _read_config_bytes(path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a config file, cached until its modification time or size changes.
+    
+    The raw bytes are cached rather than the parsed dict, so every
+    load_config() call still returns a fresh, independently mutable config.
+    """
+    return Path(path).read_bytes()
+
+def _parse_mapped(config_file: Path) -> Any:
+    """Parse a JSON file from a read-only memory map of it.
+    
+    orjson reads the mapped pages directly, so the file is never copied into
+    a Python bytes object.
+    """
+    with open(config_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+# Lets callers (e.g. tests) drop cached config file contents
+load_config.cache_clear = _read_config_bytes.cache_clear
+
+def config_with(**overrides: Any) -> Dict[str, Any]:
+    """Return the default configuration with some top-level sections replaced.
+    
+    The result is a fully mutable copy made of plain dicts and lists, like
+    load_config() returns, so it can be modified or passed to json.dumps().
+    Overrides built from DEFAULT_CONFIG_FROZEN sections are converted the
+    same way.
+    
+    Args:
+        **overrides: Configuration sections to replace, e.g. ai_improvements={...}
+        
+    Returns:
+        Configuration dictionary
+    """
+    config = orjson.loads(_DEFAULT_BYTES)
+    config.update(_thaw(overrides))
+    return config
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the read-only mappings of DEFAULT_CONFIG and DEFAULT_CONFIG_FROZEN."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError
 
 def save_config(config: Dict[str, Any], config_path: str) -> bool:
     """Save configuration to file.
@@ -128,13 +286,38 @@ def save_config(config: Dict[str, Any], config_path: str) -> bool:
     """
     try:
         config_file = Path(config_path)
-        config_file.parent.mkdir(parents=True, exist_ok=True)
+        parent = os.path.abspath(config_file.parent)
+        if parent not in _KNOWN_DIRS:
+            config_file.parent.mkdir(parents=True, exist_ok=True)
+            _KNOWN_DIRS.add(parent)
+        
+        # orjson writes UTF-8 without escaping non-ASCII text, like
+        # json.dump(..., ensure_ascii=False)
+        data = memoryview(orjson.dumps(
+            config,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ))
         
-        with open(config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        # Write the bytes straight to the file descriptor, skipping Python's
+        # buffered file layer (normally a single write(2) call)
+        # 0o666 is masked by the umask, like open(..., 'w'); O_BINARY (Windows
+        # only) stops newline translation
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        try:
+            fd = os.open(config_file, flags, 0o666)
+        except FileNotFoundError:
+            # The directory was removed after it was cached
+            config_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(config_file, flags, 0o666)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
         
         return True
         
     except Exception as e:
-        print(f"Error saving config to {config_path}: {e}")
+        logger.error("Error saving config to %s: %s", config_path, e)
         return False
\ No newline at end of file
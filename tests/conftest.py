@@ -0,0 +1,11 @@
+"""
+pytest configuration: make the project root importable once for all tests.
+"""
+
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[1])
+
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
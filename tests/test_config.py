@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Unit tests for configuration module
+"""
+
+import unittest
+import os
+import json
+import tempfile
+from unittest.mock import patch
+
+from mcp_health.utils import config as config_module
+from mcp_health.utils.config import (
+    load_config, save_config, _deep_merge, config_with, DEFAULT_CONFIG, DEFAULT_CONFIG_FROZEN
+)
+
+class TestConfig(unittest.TestCase):
+    """Test cases for loading and merging configuration files."""
+    
+    def setUp(self):
+        """Set up a temporary directory for config files."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmp_dir.name, 'config.json')
+        load_config.cache_clear()
+    
+    def tearDown(self):
+        """Remove the temporary config files."""
+        self.tmp_dir.cleanup()
+    
+    def write_config(self, text, mtime_ns=None):
+        """Write a config file, optionally with a given modification time."""
+        with open(self.config_path, 'w') as f:
+            f.write(text)
+        if mtime_ns is not None:
+            os.utime(self.config_path, ns=(mtime_ns, mtime_ns))
+    
+    def test_deep_merge_nested_sections(self):
+        """Test nested sections are merged key by key and new keys are kept."""
+        base = {'section': {'a': 1, 'nested': {'b': 2.0, 'c': 'x'}}, 'top': True}
+        merged = _deep_merge(base, {'section': {'nested': {'b': 3}}, 'extra': [1]})
+        
+        self.assertIs(merged, base)
+        self.assertEqual(merged, {'section': {'a': 1, 'nested': {'b': 3, 'c': 'x'}}, 'top': True, 'extra': [1]})
+    
+    def test_deep_merge_rejects_mismatched_types(self):
+        """Test mismatched values raise, or are skipped and reported when collecting errors."""
+        with self.assertRaises(TypeError):
+            _deep_merge({'a': 1}, {'a': 'one'})
+        with self.assertRaises(TypeError):
+            _deep_merge({'a': {'b': 1}}, {'a': 1})
+        with self.assertRaises(TypeError):
+            _deep_merge({'flag': True}, {'flag': 1})
+        
+        errors = []
+        merged = _deep_merge({'a': 1, 'b': {'c': 2.0}, 'd': 'x'}, {'a': 'one', 'b': {'c': 3}, 'd': 'y'}, errors)
+        self.assertEqual(merged, {'a': 1, 'b': {'c': 3}, 'd': 'y'})
+        self.assertEqual(errors, ['config key a must be int, got str'])
+    
+    def test_load_config_keeps_default_siblings(self):
+        """Test a partial nested section only replaces the keys it names."""
+        self.write_config('{"visualization": {"dpi": 150, "color_scheme": {"baseline": "#000000"}}}')
+        config = load_config(self.config_path)
+        
+        self.assertEqual(config['visualization']['dpi'], 150)
+        self.assertEqual(config['visualization']['default_figsize'], [12, 8])
+        self.assertEqual(config['visualization']['color_scheme']['baseline'], '#000000')
+        self.assertEqual(config['visualization']['color_scheme']['savings'], '#3498DB')
+        self.assertEqual(config['ai_improvements'], load_config()['ai_improvements'])
+    
+    def test_load_config_skips_invalid_keys(self):
+        """Test a mistyped key keeps its default without discarding the rest of the file."""
+        self.write_config('{"ai_improvements": {"admin_efficiency_gain": "high", "error_reduction": 0.5}, '
+                          '"japan_constants": {"average_hourly_wage": 3500}}')
+        
+        with self.assertLogs('mcp_health.utils.config', level='WARNING') as logs:
+            config = load_config(self.config_path)
+        
+        self.assertEqual(config['ai_improvements']['admin_efficiency_gain'], 0.52)
+        self.assertEqual(config['ai_improvements']['error_reduction'], 0.5)
+        self.assertEqual(config['japan_constants']['average_hourly_wage'], 3500)
+        self.assertIn('ai_improvements.admin_efficiency_gain', logs.output[0])
+    
+    def test_load_config_rereads_modified_file(self):
+        """Test cached file contents are dropped when the file's modification time changes."""
+        self.write_config('{"analysis_params": {"inflation_rate": 0.01}}', mtime_ns=1_000_000_000)
+        self.assertEqual(load_config(self.config_path)['analysis_params']['inflation_rate'], 0.01)
+        
+        # Same size, so only the modification time tells the versions apart
+        self.write_config('{"analysis_params": {"inflation_rate": 0.04}}', mtime_ns=2_000_000_000)
+        self.assertEqual(load_config(self.config_path)['analysis_params']['inflation_rate'], 0.04)
+    
+    def test_load_config_from_memory_map(self):
+        """Test files at or above the mmap threshold are parsed from a memory map."""
+        self.write_config('{"analysis_params": {"discount_rate": 0.05}}')
+        
+        with patch.object(config_module, '_MMAP_MIN_SIZE', 1), \
+                patch.object(config_module, '_parse_mapped', wraps=config_module._parse_mapped) as parse_mapped:
+            config = load_config(self.config_path)
+        
+        parse_mapped.assert_called_once()
+        self.assertEqual(config['analysis_params']['discount_rate'], 0.05)
+        self.assertEqual(config['analysis_params']['inflation_rate'], 0.02)
+    
+    def test_default_config_is_read_only(self):
+        """Test DEFAULT_CONFIG is read-only at the top level over plain sections."""
+        with self.assertRaises(TypeError):
+            DEFAULT_CONFIG['visualization'] = {}
+        self.assertIsInstance(DEFAULT_CONFIG['visualization']['color_scheme'], dict)
+        self.assertEqual(DEFAULT_CONFIG['visualization']['export_formats'], ['png', 'pdf', 'svg'])
+        
+        # Copies are independent of the defaults
+        config = load_config()
+        config['ai_improvements']['admin_efficiency_gain'] = 0.9
+        self.assertEqual(DEFAULT_CONFIG['ai_improvements']['admin_efficiency_gain'], 0.52)
+    
+    def test_frozen_default_config_is_read_only(self):
+        """Test the frozen defaults cannot be modified, including nested sections."""
+        with self.assertRaises(TypeError):
+            DEFAULT_CONFIG_FROZEN['visualization'] = {}
+        with self.assertRaises(TypeError):
+            DEFAULT_CONFIG_FROZEN['ai_improvements']['admin_efficiency_gain'] = 0.9
+        with self.assertRaises(TypeError):
+            DEFAULT_CONFIG_FROZEN['visualization']['color_scheme']['baseline'] = '#000000'
+        with self.assertRaises(AttributeError):
+            DEFAULT_CONFIG_FROZEN['visualization']['export_formats'].append('jpg')
+        
+        
+        # Thawed, the frozen defaults are the same values as a loaded copy
+        self.assertEqual(config_with(**DEFAULT_CONFIG_FROZEN), load_config())
+    
+    def test_config_with_returns_plain_containers(self):
+        """Test config_with results are mutable, JSON-serializable dicts and lists."""
+        config = config_with(analysis_params={'roi_analysis_years': 10},
+                             visualization=DEFAULT_CONFIG_FROZEN['visualization'])
+        
+        self.assertEqual(json.loads(json.dumps(config))['analysis_params'], {'roi_analysis_years': 10})
+        self.assertIsInstance(config['ai_improvements'], dict)
+        self.assertIsInstance(config['visualization']['color_scheme'], dict)
+        self.assertEqual(config['visualization']['export_formats'], ['png', 'pdf', 'svg'])
+        
+        config['visualization']['dpi'] = 72
+        self.assertEqual(DEFAULT_CONFIG['visualization']['dpi'], 300)
+    
+    def test_save_config_round_trip(self):
+        """Test a saved config loads back unchanged, with umask-default permissions."""
+        config = load_config()
+        config['japan_constants']['average_hourly_wage'] = 3500
+        config['output']['reports_dir'] = 'レポート/'
+        self.assertTrue(save_config(config, self.config_path))
+        
+        self.assertEqual(load_config(self.config_path), config)
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(os.stat(self.config_path).st_mode & 0o777, 0o666 & ~umask)
+    
+    def test_save_config_keeps_file_on_serialization_error(self):
+        """Test an unserializable config leaves the existing file untouched."""
+        self.write_config('{"analysis_params": {"inflation_rate": 0.01}}')
+        
+        with self.assertLogs('mcp_health.utils.config', level='ERROR'):
+            self.assertFalse(save_config({'analysis_params': object()}, self.config_path))
+        
+        with open(self.config_path) as f:
+            self.assertEqual(f.read(), '{"analysis_params": {"inflation_rate": 0.01}}')
+    
+    def test_save_config_recreates_removed_directory(self):
+        """Test saving again after the cached output directory was removed."""
+        config_dir = os.path.join(self.tmp_dir.name, 'settings')
+        config_path = os.path.join(config_dir, 'config.json')
+        self.assertTrue(save_config({'output': {'data_dir': 'a/'}}, config_path))
+        
+        os.remove(config_path)
+        os.rmdir(config_dir)
+        self.assertTrue(save_config({'output': {'data_dir': 'b/'}}, config_path))
+        self.assertEqual(load_config(config_path)['output']['data_dir'], 'b/')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Unit tests for data generator module
+"""
+
+import unittest
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from mcp_health.core.data_generator import HealthcareDataGenerator
+
+class TestHealthcareDataGenerator(unittest.TestCase):
+    """Test cases for HealthcareDataGenerator class."""
+    
+    def setUp(self):
+        """Set up a generator writing to a temporary directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tmp_dir.name)
+        self.generator = HealthcareDataGenerator(output_dir=self.tmp_dir.name)
+    
+    def tearDown(self):
+        """Remove the generated files."""
+        self.tmp_dir.cleanup()
+    
+    def test_medical_expenditure_growth(self):
+        """Test expenditure starts at the base year value and grows about 2.5% a year."""
+        expenditure = self.generator.generate_medical_expenditure_data()
+        total = expenditure['total_expenditure'].to_numpy()
+        
+        self.assertEqual(expenditure['year'].tolist(), [2019, 2020, 2021, 2022, 2023])
+        self.assertEqual(total[0], 42e12)
+        
+        # Growth rates are drawn from N(2.5%, 0.5%); 5 standard deviations either side
+        growth = total[1:] / total[:-1] - 1
+        self.assertTrue(((growth > 0.0) & (growth < 0.05)).all(), growth)
+    
+    def test_invalidate_cache_redraws_workforce(self):
+        """Test patient volumes reuse the cached workforce until the cache is invalidated."""
+        workforce = self.generator.generate_workforce_data()
+        self.generator.generate_patient_volume_data()
+        self.assertIs(self.generator._workforce_df, workforce)
+        
+        self.generator.rng = np.random.default_rng(7)
+        self.generator.invalidate_cache()
+        self.generator.generate_patient_volume_data()
+        
+        expected = HealthcareDataGenerator(output_dir=self.tmp_dir.name, random_seed=7).generate_workforce_data()
+        self.assertTrue(self.generator._workforce_df.equals(expected))
+        self.assertFalse(self.generator._workforce_df.equals(workforce))
+    
+    def test_float32_dtype_profile(self):
+        """Test the default profile narrows numeric columns except yen amounts."""
+        datasets = self.generator.generate_all_datasets(save_to_disk=False)
+        
+        for name, df in datasets.items():
+            for column, dtype in df.dtypes.items():
+                if dtype.kind == 'f':
+                    expected = 8 if column in HealthcareDataGenerator._float64_columns else 4
+                    self.assertEqual(dtype.itemsize, expected, f"{name}.{column}")
+                elif dtype.kind == 'i':
+                    self.assertEqual(dtype.itemsize, 4, f"{name}.{column}")
+        
+        self.assertEqual(datasets['medical_expenditure']['total_expenditure'].dtype, 'float64')
+        self.assertEqual(datasets['ai_implementation_costs']['upfront_cost'].dtype, 'float64')
+        self.assertEqual(datasets['administrative_costs']['hours_per_patient'].dtype, 'float32')
+        self.assertEqual(datasets['workforce']['total_workers'].dtype, 'int32')
+    
+    def test_float64_dtype_profile(self):
+        """Test the float64 profile keeps every numeric column 64-bit."""
+        generator = HealthcareDataGenerator(output_dir=self.tmp_dir.name, dtype_profile='float64')
+        datasets = generator.generate_all_datasets(save_to_disk=False)
+        
+        for name, df in datasets.items():
+            for column, dtype in df.dtypes.items():
+                if dtype.kind in 'fi':
+                    self.assertEqual(dtype.itemsize, 8, f"{name}.{column}")
+        
+        with self.assertRaises(ValueError):
+            HealthcareDataGenerator(output_dir=self.tmp_dir.name, dtype_profile='float16')
+    
+    def test_parallel_generation_matches_sequential(self):
+        """Test worker processes generate the same datasets as a sequential run."""
+        sequential = self.generator.generate_all_datasets(save_to_disk=False)
+        
+        # Pretend to have enough CPUs for generate_all_datasets to use its pool
+        with patch('mcp_health.core.data_generator.os.cpu_count', return_value=4):
+            parallel = HealthcareDataGenerator(output_dir=self.tmp_dir.name).generate_all_datasets(
+                save_to_disk=False, parallel=True)
+        
+        self.assertEqual(list(parallel), list(sequential))
+        for name, df in sequential.items():
+            self.assertTrue(parallel[name].equals(df), name)
+    
+    def test_load_or_generate_datasets_cache(self):
+        """Test cached datasets live under output_dir and still save CSV files on a cache hit."""
+        generated = self.generator.load_or_generate_datasets()
+        self.assertEqual(list(self.output_dir.glob('*.csv')), [])
+        self.assertEqual(len(list(self.output_dir.glob('_cache_seed42_float32/*/*.pkl'))), len(generated))
+        
+        cached = HealthcareDataGenerator(output_dir=self.tmp_dir.name).load_or_generate_datasets(save_to_disk=True)
+        for name, df in generated.items():
+            self.assertTrue(cached[name].equals(df))
+            self.assertTrue((self.output_dir / f"{name}.csv").is_file())
+
+if __name__ == '__main__':
+    unittest.main()
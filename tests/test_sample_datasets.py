@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Unit tests for sample datasets module
+"""
+
+import unittest
+
+from mcp_health.data.sample_datasets import get_sample_data, _DATASET_BUILDERS
+
+class TestSampleDatasets(unittest.TestCase):
+    """Test cases for get_sample_data."""
+    
+    def setUp(self):
+        """Start every test with no sample dataset built yet."""
+        for builder in _DATASET_BUILDERS.values():
+            builder.cache_clear()
+    
+    def test_returned_frames_are_copies(self):
+        """Test modifying a returned dataset does not change later results."""
+        workforce = get_sample_data('workforce')['workforce']
+        expected = workforce.copy()
+        
+        workforce['total_workers'] = 0
+        workforce.drop(index=workforce.index[:10], inplace=True)
+        
+        self.assertTrue(get_sample_data('workforce')['workforce'].equals(expected))
+        self.assertTrue(get_sample_data()['workforce'].equals(expected))
+    
+    def test_datasets_independent_of_request_order(self):
+        """Test a dataset has the same values whether built alone, first or last."""
+        alone = {name: get_sample_data(name)[name] for name in reversed(list(_DATASET_BUILDERS))}
+        
+        for builder in _DATASET_BUILDERS.values():
+            builder.cache_clear()
+        together = get_sample_data()
+        
+        self.assertEqual(list(together), list(_DATASET_BUILDERS))
+        for name, df in together.items():
+            self.assertTrue(alone[name].equals(df), name)
+
+if __name__ == '__main__':
+    unittest.main()